@@ -7,22 +7,17 @@
  * what image assets are needed
  */
 
-import { GoogleGenerativeAI } from "@google/generative-ai";
+import { getGeminiModel } from "./gemini-client.js";
 import fs from "fs-extra";
 import path from "path";
 import { fileURLToPath } from "url";
 import chalk from "chalk";
 import ora from "ora";
 import { Command } from "commander";
-import dotenv from "dotenv";
-
-dotenv.config();
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-const GEMINI_API_KEY = process.env.GEMINI_API_KEY;
-
 /**
  * Asset types and their configurations
  */
@@ -60,45 +55,15 @@ const ASSET_TYPES = {
 };
 
 /**
- * Analyze a page description to determine needed assets
+ * Static analysis instructions
  *
- * @param {string} description - Page or project description
- * @returns {Promise<Object>} - Analysis results with asset recommendations
+ * Kept ahead of the page description so every request starts with the
+ * same prompt prefix.
  */
-export async function analyzePage(description) {
-  const spinner = ora("Analyzing page requirements...").start();
-
-  try {
-    if (!GEMINI_API_KEY) {
-      throw new Error("GEMINI_API_KEY is required. Set it in .env file.");
-    }
-
-    const genAI = new GoogleGenerativeAI(GEMINI_API_KEY);
-    const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash-exp" });
-
-    const prompt = `Analyze this website/page description and determine what image assets are needed.
-
-Description: "${description}"
+const ANALYSIS_INSTRUCTIONS = `Analyze the website/page description at the end of this prompt and determine what image assets are needed.
 
 Return a JSON object with the following structure:
-{
-  "projectName": "short-name-for-project",
-  "assets": [
-    {
-      "type": "hero|icon|background|product|thumbnail|avatar",
-      "name": "asset-name",
-      "prompt": "detailed prompt for generating this image",
-      "removeBackground": true/false,
-      "convertToSvg": true/false
-    }
-  ],
-  "colorScheme": {
-    "primary": "#hexcolor",
-    "secondary": "#hexcolor",
-    "accent": "#hexcolor"
-  },
-  "style": "overall style description"
-}
+{"projectName":"short-name-for-project","assets":[{"type":"hero|icon|background|product|thumbnail|avatar","name":"asset-name","prompt":"detailed prompt for generating this image","removeBackground":true/false,"convertToSvg":true/false}],"colorScheme":{"primary":"#hexcolor","secondary":"#hexcolor","accent":"#hexcolor"},"style":"overall style description"}
 
 Guidelines:
 - For landing pages, include 1 hero, 3-5 icons, and 1 background
@@ -109,6 +74,22 @@ Guidelines:
 
 Return ONLY the JSON, no additional text.`;
 
+/**
+ * Analyze a page description to determine needed assets
+ *
+ * @param {string} description - Page or project description
+ * @returns {Promise<Object>} - Analysis results with asset recommendations
+ */
+export async function analyzePage(description) {
+  const spinner = ora("Analyzing page requirements...").start();
+
+  try {
+    const model = getGeminiModel();
+
+    const prompt = `${ANALYSIS_INSTRUCTIONS}
+
+Description: "${description}"`;
+
     const result = await model.generateContent(prompt);
     const response = result.response.text();
 
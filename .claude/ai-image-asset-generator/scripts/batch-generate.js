@@ -27,6 +27,8 @@ const DEFAULT_CONFIG = {
   outputDir: "./generated-assets",
   delayBetweenCalls: 1000, // 1 second between API calls (faster)
   maxRetries: 3,
+  retryBaseDelay: 2000, // Doubled on each retry, with jitter
+  maxConsecutiveFailures: 5, // Stop the batch once the API looks unhealthy
   processAfterGenerate: true,
   removeBackgrounds: false,
   convertToSvg: false,
@@ -37,15 +39,16 @@ const DEFAULT_CONFIG = {
  * Batch generate images from a config file or array
  *
  * @param {Object|string} config - Config object or path to config JSON
+ * @param {Object} overrides - Settings that take precedence over the config
  * @returns {Promise<Object>} - Results summary
  */
-export async function batchGenerate(config) {
+export async function batchGenerate(config, overrides = {}) {
   // Load config if it's a file path
   if (typeof config === "string") {
     config = await fs.readJson(config);
   }
 
-  const settings = { ...DEFAULT_CONFIG, ...config.settings };
+  const settings = { ...DEFAULT_CONFIG, ...config.settings, ...overrides };
   const assets = config.assets || [];
 
   console.log(chalk.cyan("\n🎨 Batch Image Generation\n"));
@@ -53,6 +56,7 @@ export async function batchGenerate(config) {
   console.log(chalk.white(`Total Assets:     ${assets.length}`));
   console.log(chalk.white(`Output Directory: ${settings.outputDir}`));
   console.log(chalk.white(`Delay:            ${settings.delayBetweenCalls}ms`));
+  console.log(chalk.white(`Concurrency:      ${settings.concurrency}`));
   console.log(chalk.gray("━".repeat(50) + "\n"));
 
   // Ensure output directory exists
@@ -65,96 +69,74 @@ export async function batchGenerate(config) {
     assets: []
   };
 
-  // Process assets
-  for (let i = 0; i < assets.length; i++) {
-    const asset = assets[i];
-    const assetName = asset.name || `asset-${i + 1}`;
+  // Process assets, keeping up to `concurrency` generations in flight
+  const concurrency = Math.max(1, parseInt(settings.concurrency) || 1);
+  let nextIndex = 0;
+  let consecutiveFailures = 0;
 
-    console.log(chalk.blue(`\n[${i + 1}/${assets.length}] ${assetName}`));
+  // Animated spinners from parallel workers overwrite each other, so only
+  // show them when assets are processed one at a time
+  settings.spinner = concurrency === 1;
 
-    try {
-      // Generate the image
-      const outputPath = path.join(
-        settings.outputDir,
-        asset.output || `${assetName}.png`
-      );
-
-      const result = await generateImage({
-        prompt: asset.prompt,
-        style: asset.style || settings.defaultStyle,
-        size: asset.size || settings.defaultSize || "1024x1024",
-        output: outputPath,
-        negative: asset.negative,
-        quality: asset.quality || "high"
-      });
-
-      let assetResult = {
-        name: assetName,
-        success: result.success,
-        generatedPath: result.filePath || result.description,
-        processedPaths: []
-      };
+  const circuitOpen = () => consecutiveFailures >= settings.maxConsecutiveFailures;
 
-      // Post-processing if enabled and generation succeeded
-      if (result.success && result.filePath) {
-        // Remove background if specified
-        if (asset.removeBackground || settings.removeBackgrounds) {
-          try {
-            const bgResult = await removeBackground({
-              input: result.filePath,
-              backgroundColor: asset.backgroundColor || "#FFFFFF"
-            });
-            assetResult.processedPaths.push({
-              type: "no-background",
-              path: bgResult.outputPath
-            });
-            console.log(chalk.gray(`  ✓ Background removed`));
-          } catch (e) {
-            console.log(chalk.yellow(`  ⚠ Background removal failed: ${e.message}`));
-          }
-        }
+  const worker = async () => {
+    while (nextIndex < assets.length && !circuitOpen()) {
+      const i = nextIndex++;
+      const asset = assets[i];
+      const assetName = asset.name || `asset-${i + 1}`;
 
-        // Convert to SVG if specified
-        if (asset.convertToSvg || settings.convertToSvg) {
-          try {
-            const inputForSvg = assetResult.processedPaths.find(p => p.type === "no-background")?.path
-              || result.filePath;
-
-            const svgResult = await convertToSvg({
-              input: inputForSvg,
-              mode: asset.svgMode || "trace",
-              color: asset.svgColor || "#000000"
-            });
-            assetResult.processedPaths.push({
-              type: "svg",
-              path: svgResult.outputPath
-            });
-            console.log(chalk.gray(`  ✓ Converted to SVG`));
-          } catch (e) {
-            console.log(chalk.yellow(`  ⚠ SVG conversion failed: ${e.message}`));
-          }
+      console.log(chalk.blue(`\n[${i + 1}/${assets.length}] ${assetName}`));
+
+      try {
+        const assetResult = await processAsset(asset, assetName, settings);
+
+        results.assets[i] = assetResult;
+        if (assetResult.success) {
+          results.successful++;
+          consecutiveFailures = 0;
+        } else {
+          results.failed++;
+          consecutiveFailures++;
         }
-      }
 
-      results.assets.push(assetResult);
-      results.successful++;
+        // Delay between API calls
+        if (nextIndex < assets.length) {
+          await sleep(settings.delayBetweenCalls);
+        }
 
-      // Delay between API calls
-      if (i < assets.length - 1) {
-        await sleep(settings.delayBetweenCalls);
+      } catch (error) {
+        console.error(chalk.red(`  ✗ Failed: ${error.message}`));
+        results.assets[i] = {
+          name: assetName,
+          success: false,
+          error: error.message
+        };
+        results.failed++;
+        consecutiveFailures++;
+
+        // Longer delay after errors
+        await sleep(settings.delayBetweenCalls * 2);
       }
+    }
+  };
 
-    } catch (error) {
-      console.error(chalk.red(`  ✗ Failed: ${error.message}`));
-      results.assets.push({
-        name: assetName,
+  await Promise.all(
+    Array.from({ length: Math.min(concurrency, assets.length) }, worker)
+  );
+
+  // Skip the remaining assets instead of hammering a failing API
+  if (nextIndex < assets.length) {
+    console.log(chalk.yellow(
+      `\n⚠ Stopping after ${consecutiveFailures} consecutive failures, skipping ${assets.length - nextIndex} asset(s)`
+    ));
+    for (let i = nextIndex; i < assets.length; i++) {
+      results.assets[i] = {
+        name: assets[i].name || `asset-${i + 1}`,
         success: false,
-        error: error.message
-      });
+        error: "Skipped after consecutive failures"
+      };
       results.failed++;
-
-      // Longer delay after errors
-      await sleep(settings.delayBetweenCalls * 2);
     }
   }
 
@@ -173,6 +155,113 @@ export async function batchGenerate(config) {
   return results;
 }
 
+/**
+ * Generate a single asset and run its post-processing steps
+ *
+ * @param {Object} asset - Asset entry from the batch config
+ * @param {string} assetName - Resolved asset name
+ * @param {Object} settings - Batch settings
+ * @returns {Promise<Object>} - Per-asset result entry
+ */
+async function processAsset(asset, assetName, settings) {
+  // Generate the image
+  const outputPath = path.join(
+    settings.outputDir,
+    asset.output || `${assetName}.png`
+  );
+
+  const result = await generateWithRetry({
+    prompt: asset.prompt,
+    style: asset.style || settings.defaultStyle,
+    size: asset.size || settings.defaultSize || "1024x1024",
+    output: outputPath,
+    negative: asset.negative,
+    quality: asset.quality || "high",
+    spinner: settings.spinner
+  }, settings);
+
+  let assetResult = {
+    name: assetName,
+    success: result.success,
+    generatedPath: result.filePath || result.description,
+    processedPaths: []
+  };
+
+  // Post-processing if enabled and generation succeeded
+  if (result.success && result.filePath) {
+    // Remove background if specified
+    if (asset.removeBackground || settings.removeBackgrounds) {
+      try {
+        const bgResult = await removeBackground({
+          input: result.filePath,
+          backgroundColor: asset.backgroundColor || "#FFFFFF",
+          spinner: settings.spinner
+        });
+        assetResult.processedPaths.push({
+          type: "no-background",
+          path: bgResult.outputPath
+        });
+        console.log(chalk.gray(`  ✓ Background removed`));
+      } catch (e) {
+        console.log(chalk.yellow(`  ⚠ Background removal failed: ${e.message}`));
+      }
+    }
+
+    // Convert to SVG if specified
+    if (asset.convertToSvg || settings.convertToSvg) {
+      try {
+        const inputForSvg = assetResult.processedPaths.find(p => p.type === "no-background")?.path
+          || result.filePath;
+
+        const svgResult = await convertToSvg({
+          input: inputForSvg,
+          mode: asset.svgMode || "trace",
+          color: asset.svgColor || "#000000",
+          spinner: settings.spinner
+        });
+        assetResult.processedPaths.push({
+          type: "svg",
+          path: svgResult.outputPath
+        });
+        console.log(chalk.gray(`  ✓ Converted to SVG`));
+      } catch (e) {
+        console.log(chalk.yellow(`  ⚠ SVG conversion failed: ${e.message}`));
+      }
+    }
+  }
+
+  return assetResult;
+}
+
+/**
+ * Generate an image, retrying rate-limit and server errors with
+ * exponential backoff and jitter
+ *
+ * @param {Object} options - Options passed through to generateImage
+ * @param {Object} settings - Batch settings (maxRetries, retryBaseDelay)
+ * @returns {Promise<Object>} - Result of the last attempt
+ */
+async function generateWithRetry(options, settings) {
+  for (let attempt = 0; ; attempt++) {
+    const result = await generateImage(options);
+
+    if (result.success || !isRetryable(result) || attempt >= settings.maxRetries) {
+      return result;
+    }
+
+    const delay = Math.round(settings.retryBaseDelay * 2 ** attempt * (0.5 + Math.random()));
+    console.log(chalk.yellow(`  ↻ Retrying in ${delay}ms (${attempt + 1}/${settings.maxRetries})`));
+    await sleep(delay);
+  }
+}
+
+/**
+ * Whether a failed generation is worth retrying (429 or 5xx)
+ */
+function isRetryable(result) {
+  return result.status === 429 || result.status >= 500;
+}
+
 /**
  * Sleep helper
  */
@@ -188,6 +277,7 @@ export function createBatchConfig(prompts, options = {}) {
     settings: {
       outputDir: options.outputDir || DEFAULT_CONFIG.outputDir,
       delayBetweenCalls: options.delay || DEFAULT_CONFIG.delayBetweenCalls,
+      concurrency: options.concurrency || DEFAULT_CONFIG.concurrency,
       removeBackgrounds: options.removeBackgrounds || false,
       convertToSvg: options.convertToSvg || false,
       defaultStyle: options.style || "modern, professional, high quality",
@@ -286,6 +376,7 @@ export async function generateLandingPageAssets(description, options = {}) {
     settings: {
       outputDir: options.outputDir || "./landing-page-assets",
       delayBetweenCalls: 1000, // Fast 1 second delay
+      concurrency: options.concurrency || DEFAULT_CONFIG.concurrency,
       removeBackgrounds: false, // Per-asset control
       convertToSvg: false // Per-asset control
     },
@@ -311,7 +402,8 @@ export async function generateIconSet(icons, options = {}) {
   return await batchGenerate({
     settings: {
       outputDir: options.outputDir || "./icons",
-      delayBetweenCalls: options.delay || 2000
+      delayBetweenCalls: options.delay || 2000,
+      concurrency: options.concurrency || DEFAULT_CONFIG.concurrency
     },
     assets
   });
@@ -332,6 +424,7 @@ program
   .option("-p, --prompts <prompts...>", "List of prompts to generate")
   .option("-o, --output <directory>", "Output directory", DEFAULT_CONFIG.outputDir)
   .option("-d, --delay <ms>", "Delay between API calls", String(DEFAULT_CONFIG.delayBetweenCalls))
+  .option("-j, --concurrency <n>", `Number of images to generate in parallel (default: ${DEFAULT_CONFIG.concurrency}; progress spinners are disabled above 1)`)
   .option("--remove-bg", "Remove backgrounds from all images")
   .option("--to-svg", "Convert all images to SVG")
   .option("-s, --style <style>", "Default style for all images")
@@ -339,12 +432,15 @@ program
   .option("--landing-page <description>", "Generate landing page assets for description")
   .option("--icons <icons...>", "Generate icon set")
   .action(async (options) => {
+    const concurrency = options.concurrency ? parseInt(options.concurrency) : undefined;
+
     try {
       if (options.landingPage) {
         // Generate landing page assets
         console.log(chalk.cyan(`\n🏠 Generating Landing Page Assets for: ${options.landingPage}\n`));
         await generateLandingPageAssets(options.landingPage, {
-          outputDir: options.output
+          outputDir: options.output,
+          concurrency
         });
 
       } else if (options.icons && options.icons.length > 0) {
@@ -353,18 +449,20 @@ program
         await generateIconSet(options.icons, {
           outputDir: options.output,
           style: options.style,
-          delay: parseInt(options.delay)
+          delay: parseInt(options.delay),
+          concurrency
         });
 
       } else if (options.config) {
-        // Use config file
-        await batchGenerate(options.config);
+        // Use config file; a -j flag overrides its concurrency setting
+        await batchGenerate(options.config, concurrency ? { concurrency } : {});
 
       } else if (options.prompts && options.prompts.length > 0) {
         // Generate from prompt list
         const config = createBatchConfig(options.prompts, {
           outputDir: options.output,
           delay: parseInt(options.delay),
+          concurrency,
           removeBackgrounds: options.removeBg,
           convertToSvg: options.toSvg,
           style: options.style,
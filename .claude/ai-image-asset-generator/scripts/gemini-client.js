@@ -0,0 +1,51 @@
+/**
+ * Gemini Client
+ *
+ * Shared Gemini API client for the generation and analysis scripts.
+ * The client and each distinct model configuration are created on
+ * first use and reused for every later call.
+ */
+
+import { GoogleGenerativeAI } from "@google/generative-ai";
+import dotenv from "dotenv";
+
+// Load environment variables
+dotenv.config();
+
+// Default Gemini model used by all scripts
+export const GEMINI_MODEL = "gemini-2.0-flash-exp";
+
+let genAI = null;
+const models = new Map();
+
+/**
+ * Initialize Gemini client
+ */
+function initializeGemini() {
+  if (!genAI) {
+    const apiKey = process.env.GEMINI_API_KEY;
+    if (!apiKey) {
+      throw new Error("GEMINI_API_KEY is required. Set it in .env file.");
+    }
+    genAI = new GoogleGenerativeAI(apiKey);
+  }
+  return genAI;
+}
+
+/**
+ * Get a shared Gemini model for the given model parameters
+ *
+ * @param {Object} params - Model parameters passed to getGenerativeModel
+ * @returns {GenerativeModel} - Cached model instance
+ */
+export function getGeminiModel(params = { model: GEMINI_MODEL }) {
+  const key = JSON.stringify(params);
+  let model = models.get(key);
+  if (!model) {
+    model = initializeGemini().getGenerativeModel(params);
+    models.set(key, model);
+  }
+  return model;
+}
+
+export default getGeminiModel;
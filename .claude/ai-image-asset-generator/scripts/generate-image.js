@@ -7,40 +7,35 @@
  * Supports custom prompts, styles, sizes, and output paths
  */
 
-import { GoogleGenerativeAI } from "@google/generative-ai";
+import { getGeminiModel, GEMINI_MODEL } from "./gemini-client.js";
 import fs from "fs-extra";
 import path from "path";
 import { fileURLToPath } from "url";
 import chalk from "chalk";
 import ora from "ora";
 import { Command } from "commander";
-import dotenv from "dotenv";
-
-// Load environment variables
-dotenv.config();
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
 // Default configuration
 const DEFAULT_CONFIG = {
-  model: "gemini-2.0-flash-exp",
+  model: GEMINI_MODEL,
   outputDir: "./generated-assets",
   defaultSize: "1024x1024",
   defaultStyle: "modern, professional, high quality"
 };
 
-// API Key - must be set via environment variable
-const GEMINI_API_KEY = process.env.GEMINI_API_KEY;
-
 /**
- * Initialize Gemini client
+ * Get the shared image generation model
  */
-function initializeGemini(apiKey = GEMINI_API_KEY) {
-  if (!apiKey) {
-    throw new Error("GEMINI_API_KEY is required. Set it in .env file.");
-  }
-  return new GoogleGenerativeAI(apiKey);
+function getImageModel() {
+  return getGeminiModel({
+    model: DEFAULT_CONFIG.model,
+    generationConfig: {
+      responseModalities: ["Text", "Image"]
+    }
+  });
 }
 
 /**
@@ -53,6 +48,7 @@ function initializeGemini(apiKey = GEMINI_API_KEY) {
  * @param {string} options.output - Output file path
  * @param {string} options.negative - Negative prompt (what to avoid)
  * @param {string} options.quality - Quality level
+ * @param {boolean} options.spinner - Show an animated spinner (default: true)
  * @returns {Promise<Object>} - Generation result
  */
 export async function generateImage(options) {
@@ -62,19 +58,17 @@ export async function generateImage(options) {
     size = DEFAULT_CONFIG.defaultSize,
     output,
     negative = "",
-    quality = "high"
+    quality = "high",
+    spinner: showSpinner = true
   } = options;
 
-  const spinner = ora(`Generating image: "${prompt.substring(0, 50)}..."`).start();
+  const spinner = ora({
+    text: `Generating image: "${prompt.substring(0, 50)}..."`,
+    ...(showSpinner ? {} : { isEnabled: false })
+  }).start();
 
   try {
-    const genAI = initializeGemini();
-    const model = genAI.getGenerativeModel({
-      model: DEFAULT_CONFIG.model,
-      generationConfig: {
-        responseModalities: ["Text", "Image"]
-      }
-    });
+    const model = getImageModel();
 
     // Build the full prompt
     let fullPrompt = prompt;
@@ -147,20 +141,25 @@ export async function generateImage(options) {
     spinner.fail(`Generation failed: ${error.message}`);
     return {
       success: false,
-      error: error.message
+      error: error.message,
+      status: error.status
     };
   }
 }
 
+// Matches {{key}} placeholders in prompt templates
+const PLACEHOLDER_PATTERN = /{{([^{}]+)}}/g;
+
 /**
  * Generate a prompt based on template and context
+ *
+ * Substitutes all placeholders in a single pass over the template,
+ * looking each key up in the context directly. Unknown keys are left as-is.
  */
 export function generateImagePrompt(template, context) {
-  let prompt = template;
-  for (const [key, value] of Object.entries(context)) {
-    prompt = prompt.replace(new RegExp(`{{${key}}}`, "g"), value);
-  }
-  return prompt;
+  return template.replace(PLACEHOLDER_PATTERN, (match, key) =>
+    Object.hasOwn(context, key) ? String(context[key]) : match
+  );
 }
 
 /**
@@ -32,6 +32,7 @@ const posterize = promisify(potrace.posterize);
  * @param {string} options.output - Output SVG path
  * @param {string} options.mode - Conversion mode (trace, posterize)
  * @param {Object} options.traceOptions - Potrace options
+ * @param {boolean} options.spinner - Show an animated spinner (default: true)
  * @returns {Promise<Object>} - Result with file path and metadata
  */
 export async function convertToSvg(options) {
@@ -47,12 +48,14 @@ export async function convertToSvg(options) {
     optCurve = true,
     optTolerance = 0.2,
     steps = 4, // For posterize mode
-    fillStrategy = "dominant"
+    fillStrategy = "dominant",
+    spinner: showSpinner = true
   } = options;
 
   const spinner = ora({
     text: chalk.blue(`Converting: ${path.basename(input)}`),
-    spinner: "dots"
+    spinner: "dots",
+    ...(showSpinner ? {} : { isEnabled: false })
   }).start();
 
   try {
@@ -31,6 +31,7 @@ const __dirname = path.dirname(__filename);
  * @param {string} options.output - Output image path
  * @param {string} options.backgroundColor - Background color to remove (default: white)
  * @param {number} options.threshold - Color matching threshold (0-255, default: 30)
+ * @param {boolean} options.spinner - Show an animated spinner (default: true)
  * @returns {Promise<Object>} - Result with file path and metadata
  */
 export async function removeBackground(options) {
@@ -39,12 +40,14 @@ export async function removeBackground(options) {
     output,
     backgroundColor = "#FFFFFF",
     threshold = 30,
-    feather = 2
+    feather = 2,
+    spinner: showSpinner = true
   } = options;
 
   const spinner = ora({
     text: chalk.blue(`Processing: ${path.basename(input)}`),
-    spinner: "dots"
+    spinner: "dots",
+    ...(showSpinner ? {} : { isEnabled: false })
   }).start();
 
   try {
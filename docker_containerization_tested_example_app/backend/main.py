@@ -1,9 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from datetime import datetime
+from collections import deque
+from typing import Optional
 
-app = FastAPI(title="MyApp API", version="1.0.0")
+app = FastAPI(
+    title="MyApp API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # CORS middleware for React frontend
 app.add_middleware(
@@ -14,35 +22,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as the item list; small bodies are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
+
 class Item(BaseModel):
     name: str
-    description: str = None
+    description: Optional[str] = None
+
+# In-memory storage, capped so oldest items are dropped first
+MAX_ITEMS = 10000
+items = deque(maxlen=MAX_ITEMS)
 
-# In-memory storage
-items = []
+# Static response bodies, built once at import
+ROOT_RESPONSE = {"message": "Welcome to FastAPI Backend!", "version": "1.0.0"}
+APP_INFO = {
+    "app": "FastAPI Backend",
+    "framework": "FastAPI",
+    "python_version": "3.11",
+}
 
 @app.get("/")
-def root():
-    return {"message": "Welcome to FastAPI Backend!", "version": "1.0.0"}
+async def root():
+    return ROOT_RESPONSE
 
 @app.get("/api/health")
-def health_check():
+async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 @app.get("/api/items")
-def get_items():
-    return {"items": items}
+async def get_items():
+    return {"items": list(items)}
 
 @app.post("/api/items")
-def create_item(item: Item):
-    items.append(item.dict())
+async def create_item(item: Item):
+    items.append(item.model_dump())
     return {"message": "Item created", "item": item}
 
 @app.get("/api/info")
-def get_info():
-    return {
-        "app": "FastAPI Backend",
-        "framework": "FastAPI",
-        "python_version": "3.11",
-        "items_count": len(items)
-    }
+async def get_info():
+    return {**APP_INFO, "items_count": len(items)}